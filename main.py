@@ -1,16 +1,24 @@
-import requests
+import aiohttp
+from aiohttp import web
 import time
 import random
 import os
-import json
+import orjson
+import tempfile
+import math
+import numpy as np
 import discord
 from discord import app_commands, Intents
 import asyncio
+from email.utils import parsedate_to_datetime
 from typing import List, Dict, Any
-from flask import Flask
-from threading import Thread
 from discord.ext import tasks
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; NumPy handles filtering without it
+    njit = None
+
 #  1. CONFIGURATION 
 DISCORD_BOT_TOKEN_ENV_VAR = "DISCORD_BOT_TOKEN"
 WOOT_API_KEY_ENV_VAR = "WOOT_API_KEY"
@@ -21,6 +29,16 @@ BASE_API_URL = "https://developer.woot.com"
 PERSISTENCE_FILE = "historical_lows.json"
 SETTINGS_FILE = "bot_settings.json"  # New file for alert channel configuration
 MAX_DEALS_PER_PAGE = 10
+MAX_RANKED_DEALS = 50  # Deals listed (by discount) by /deals
+
+# Concurrency limits for feed requests (adjusted on 429 responses)
+MIN_FETCH_CONCURRENCY = 1
+MAX_FETCH_CONCURRENCY = 16
+MAX_RETRY_DELAY_SECONDS = 30
+FETCH_ATTEMPTS = 3
+
+# How long a single feed's payload is reused, even on a forced refresh
+PER_FEED_TTL = 120
 
 # The list of feeds to check (11 total calls per command)
 FEED_NAMES = [
@@ -37,17 +55,30 @@ MIN_SALE_PRICE = 75.00
 MIN_PERCENT_OFF_LOW_TIER = 50
 MIN_DOLLAR_SAVINGS = 40.00
 
+# Slack for the unrounded vectorized pre-filter; round(x, 2) >= T implies
+# x >= T - 0.005, so this never drops a deal the exact rules would accept
+ROUNDING_MARGIN = 0.01
+
+# Feeds at least this large are filtered by the numba kernel (if installed)
+NUMBA_DEAL_THRESHOLD = 2000
+
 # Global caching state
 historical_lows_cache = {}
+historical_lows_dirty = False
+_settings_cache: dict | None = None
+_settings_mtime: float = 0
 
 
 def load_historical_lows():
     """Loads historical prices from the local JSON file into memory."""
     global historical_lows_cache
+    # Unsaved lows only exist in memory; reloading would silently drop them
+    if historical_lows_dirty:
+        return historical_lows_cache
     if os.path.exists(PERSISTENCE_FILE):
         try:
-            with open(PERSISTENCE_FILE, 'r') as f:
-                historical_lows_cache = json.load(f)
+            with open(PERSISTENCE_FILE, 'rb') as f:
+                historical_lows_cache = orjson.loads(f.read())
         except Exception as e:
             print(
                 f"WARNING: Could not load historical lows file. Starting with empty cache: {e}"
@@ -57,35 +88,94 @@ def load_historical_lows():
 
 
 def save_historical_low(offer_id, price):
-    """Saves a new historical low price to the cache and persists to JSON."""
-    global historical_lows_cache
+    """Records a new historical low price in the cache (persisted on flush)."""
+    global historical_lows_dirty
     historical_lows_cache[offer_id] = price
+    historical_lows_dirty = True
+
+
+def _write_json_atomic(path, data):
+    """
+    Writes JSON to a temp file next to the target, syncs it to disk, then swaps
+    it into place, keeping the target's existing permissions.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
     try:
-        with open(PERSISTENCE_FILE, 'w') as f:
-            json.dump(historical_lows_cache, f, indent=4)
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    with tempfile.NamedTemporaryFile('wb', dir=directory, delete=False) as f:
+        temp_path = f.name
+        try:
+            f.write(
+                orjson.dumps(data,
+                             option=orjson.OPT_INDENT_2
+                             | orjson.OPT_NON_STR_KEYS))
+            f.flush()
+            os.fsync(f.fileno())
+        except Exception:
+            f.close()
+            os.remove(temp_path)
+            raise
+    try:
+        # NamedTemporaryFile is created 0600, which os.replace would keep
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except Exception:
+        os.remove(temp_path)
+        raise
+
+
+async def flush_historical_lows():
+    """
+    Persists the historical lows cache to JSON once, if it has changed.
+    The write runs in a worker thread so slow disks don't stall the bot.
+    """
+    global historical_lows_dirty
+    if not historical_lows_dirty:
+        return
+    # Snapshot so the event loop can keep updating the cache mid-write
+    snapshot = dict(historical_lows_cache)
+    historical_lows_dirty = False
+    try:
+        await asyncio.to_thread(_write_json_atomic, PERSISTENCE_FILE, snapshot)
     except Exception as e:
+        historical_lows_dirty = True
         print(f"ERROR saving historical lows to file: {e}")
 
 
 def load_settings():
-    """Loads bot settings from a local JSON file."""
-    if os.path.exists(SETTINGS_FILE):
-        try:
-            with open(SETTINGS_FILE, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"WARNING: Could not load settings file: {e}")
-            return {}
-    return {}
+    """Loads bot settings, re-reading the JSON file only when it has changed."""
+    global _settings_cache, _settings_mtime
+    try:
+        mtime = os.path.getmtime(SETTINGS_FILE)
+    except OSError:
+        _settings_cache, _settings_mtime = {}, 0
+        return _settings_cache
+
+    if _settings_cache is not None and mtime == _settings_mtime:
+        return _settings_cache
+
+    try:
+        with open(SETTINGS_FILE, 'rb') as f:
+            _settings_cache = orjson.loads(f.read())
+        _settings_mtime = mtime
+    except Exception as e:
+        print(f"WARNING: Could not load settings file: {e}")
+        return {}
+    return _settings_cache
 
 
 def save_setting(key, value):
     """Saves a specific setting key/value pair and persists to JSON."""
-    settings = load_settings()
+    global _settings_cache, _settings_mtime
+    # Work on a copy so a failed write never leaks into the shared cache
+    settings = dict(load_settings())
     settings[key] = value
     try:
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=4)
+        _write_json_atomic(SETTINGS_FILE, settings)
+        _settings_cache = settings
+        _settings_mtime = os.path.getmtime(SETTINGS_FILE)
         return True
     except Exception as e:
         print(f"ERROR saving settings to file: {e}")
@@ -95,27 +185,80 @@ def save_setting(key, value):
 #  4. API UTILITY FUNCTION
 
 
-def fetch_feed_data(feed_name, api_key):
-    """Fetches deals for a specific feed (Synchronous request)."""
+def get_retry_delay(headers, attempt):
+    """
+    Works out how long to wait after a 429, preferring the server's own advice
+    (Retry-After, then X-RateLimit-Reset) over exponential backoff.
+    """
+    retry_after = headers.get('Retry-After')
+    if retry_after:
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after).timestamp()
+                seconds = retry_at - time.time()
+            except (TypeError, ValueError):
+                seconds = None
+        # float() also accepts 'nan'/'inf', which must not reach sleep()
+        if seconds is not None and math.isfinite(seconds):
+            return min(max(seconds, 0.0), MAX_RETRY_DELAY_SECONDS)
+
+    reset = headers.get('X-RateLimit-Reset')
+    if reset:
+        try:
+            seconds = float(reset)
+        except ValueError:
+            seconds = None
+        if seconds is not None and math.isfinite(seconds):
+            # Large values are epoch timestamps, small ones are seconds to wait
+            if seconds > 1_000_000_000:
+                seconds -= time.time()
+            return min(max(seconds, 0.0), MAX_RETRY_DELAY_SECONDS)
+
+    return 2**attempt + random.uniform(0.5, 1)
+
+
+async def fetch_feed_data(session: aiohttp.ClientSession,
+                          feed_name,
+                          api_key,
+                          on_rate_limit=None,
+                          on_success=None):
+    """
+    Fetches deals for a specific feed using the shared aiohttp session.
+    The optional callbacks let the caller adapt its concurrency to 429s.
+    """
     endpoint = f"{BASE_API_URL}/feed/{feed_name}"
-    headers = {'Accept': 'application/json', 'x-api-key': api_key}
+    headers = {'x-api-key': api_key}
 
-    for attempt in range(3):
+    for attempt in range(FETCH_ATTEMPTS):
+        delay = 0
         try:
-            response = requests.get(endpoint, headers=headers, timeout=10)
-            if response.status_code == 200:
-                return response.json().get('Items', [])
-            elif response.status_code == 429:  # Rate Limit Hit
-                delay = 2**attempt + random.uniform(0.5, 1)
-                time.sleep(delay)
-            else:
-                response.raise_for_status()
-        except requests.exceptions.Timeout:
+            async with session.get(endpoint, headers=headers) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    if on_success:
+                        on_success()
+                    return data.get('Items', [])
+                elif response.status == 429:  # Rate Limit Hit
+                    if on_rate_limit:
+                        on_rate_limit()
+                    delay = get_retry_delay(response.headers, attempt)
+                else:
+                    response.raise_for_status()
+            # Sleep outside the context manager so the connection is released,
+            # and not at all after the last attempt since nothing follows it
+            if delay and attempt < FETCH_ATTEMPTS - 1:
+                await asyncio.sleep(delay)
+        except asyncio.TimeoutError:
             print(f"Request to {feed_name} timed out.")
             continue
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"Error fetching {feed_name}: {e}")
             break
+        except orjson.JSONDecodeError as e:
+            print(f"Invalid JSON received from {feed_name}: {e}")
+            break
     return []
 
 
@@ -155,9 +298,49 @@ def process_deal_data(raw_deal_data, feed_name):
         except (TypeError, AttributeError):
             pass
 
+    # Lowercased once here so /search doesn't redo it on every query
+    deal['_title_lower'] = deal['title'].lower()
+
     return deal
 
 
+def _price_minimum(raw_deal_data, key):
+    """Returns the numeric 'Minimum' of a price block, or NaN if unusable."""
+    price_data = raw_deal_data.get(key)
+    if not price_data:
+        return np.nan
+    try:
+        value = price_data.get('Minimum')
+    except AttributeError:
+        return np.nan
+    return float(value) if isinstance(value, (int, float)) else np.nan
+
+
+if njit is not None:
+
+    # No fastmath: unusable prices are NaN and must keep failing comparisons
+    @njit(cache=True)
+    def _filter_kernel(sale, list_, sold_out, min_sale, min_savings,
+                       min_percent, margin):
+        """Native-code version of the candidate pre-filter for large feeds."""
+        indices = np.empty(sale.shape[0], dtype=np.intp)
+        count = 0
+        for i in range(sale.shape[0]):
+            s = sale[i]
+            l = list_[i]
+            if sold_out[i] or not (l > 0 and l > s and s >= min_sale):
+                continue
+            if l - s < min_savings - margin:
+                continue
+            if (l - s) / l * 100 < min_percent - margin:
+                continue
+            indices[count] = i
+            count += 1
+        return indices[:count]
+else:
+    _filter_kernel = None
+
+
 def passes_strict_rules(deal):
     """Checks if a deal meets all minimum quality requirements."""
     if deal['sale_price'] is None or deal['is_sold_out']:
@@ -175,43 +358,91 @@ def passes_strict_rules(deal):
     return True
 
 
-def format_deal_message(deals: List[Dict[str, Any]], page: int,
-                        total_pages: int, title: str) -> str:
-    """
-    Formats a list of deals into a readable Discord message page, ensuring the content
-    does not exceed the 2000-character limit.
+def candidate_deal_indices(deals_data) -> np.ndarray:
     """
+    Pre-filters a whole feed at once and returns the indices of the raw deals
+    that may pass the strict rules. Prices are pulled into flat arrays so the
+    discount/savings math and the checks run as single NumPy passes.
 
-    start_index = page * MAX_DEALS_PER_PAGE
-    end_index = start_index + MAX_DEALS_PER_PAGE
-    page_deals = deals[start_index:end_index]
+    The savings/discount checks use unrounded values with ROUNDING_MARGIN of
+    slack, so the result is a superset; callers confirm each candidate with
+    passes_strict_rules, which applies the exact round()-based rules.
+    """
+    count = len(deals_data)
+    if count == 0:
+        return np.empty(0, dtype=np.intp)
+
+    sale = np.fromiter((_price_minimum(d, 'SalePrice') for d in deals_data),
+                       dtype=np.float64,
+                       count=count)
+    list_ = np.fromiter((_price_minimum(d, 'ListPrice') for d in deals_data),
+                        dtype=np.float64,
+                        count=count)
+    sold_out = np.fromiter(
+        (bool(d.get('IsSoldOut', True)) for d in deals_data),
+        dtype=np.bool_,
+        count=count)
+
+    if _filter_kernel is not None and count >= NUMBA_DEAL_THRESHOLD:
+        return _filter_kernel(sale, list_, sold_out, MIN_SALE_PRICE,
+                              MIN_DOLLAR_SAVINGS, MIN_PERCENT_OFF_LOW_TIER,
+                              ROUNDING_MARGIN)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        savings = list_ - sale
+        discount = savings / list_ * 100
+        # NaN prices compare False everywhere, so they drop out here
+        mask = ((list_ > 0) & (list_ > sale) & ~sold_out
+                & (sale >= MIN_SALE_PRICE)
+                & (savings >= MIN_DOLLAR_SAVINGS - ROUNDING_MARGIN)
+                & (discount >= MIN_PERCENT_OFF_LOW_TIER - ROUNDING_MARGIN))
+
+    return np.flatnonzero(mask)
+
+
+# Per-deal message block, filled from the deal dict via str.format_map
+_DEAL_TMPL = (
+    "**{title}** ({feed_name})\n"
+    "> 🏷️ **{status}** | **{discount_percent:.0f}% OFF** | **Price:** ${sale_price:.2f} (Save ${savings_amount:.2f})\n"
+    "> 🔗 <{url}>\n\n")
+
+
+def format_deal(deal: Dict[str, Any]) -> str:
+    """Formats a single deal into its Discord message block."""
+    return _DEAL_TMPL.format_map(deal)
+
+
+def assemble_deal_page(page_deal_strings: List[str], page: int,
+                       total_pages: int, title: str) -> str:
+    """
+    Assembles one page of already-formatted deal blocks into a readable Discord
+    message, ensuring the content does not exceed the 2000-character limit.
+    """
 
     header = f"✨ **{title}** (Page {page + 1}/{total_pages}) ✨\n\n"
 
-    if not deals:
+    if not page_deal_strings:
         return "😔 No exceptional deals found that meet the strict rules at this time."
 
-    response_msg = header
+    parts = [header]
+    running_len = len(header)
     MAX_LENGTH = 1950
 
     deals_added_count = 0
-    for deal in page_deals:
-        # Generate the formatted content for this single deal
-        deal_content = (
-            f"**{deal['title']}** ({deal['feed_name']})\n"
-            f"> 🏷️ **{deal['status']}** | **{deal['discount_percent']:.0f}% OFF** | **Price:** ${deal['sale_price']:.2f} (Save ${deal['savings_amount']:.2f})\n"
-            f"> 🔗 <{deal['url']}>\n\n")
-
-        if len(response_msg) + len(deal_content) > MAX_LENGTH:
-            remaining_deals = len(page_deals) - deals_added_count
+    for deal_content in page_deal_strings:
+        if running_len + len(deal_content) > MAX_LENGTH:
+            remaining_deals = len(page_deal_strings) - deals_added_count
             if remaining_deals > 0:
-                response_msg += f"...and {remaining_deals} more deals on this page (Character Limit Reached)."
+                parts.append(
+                    f"...and {remaining_deals} more deals on this page (Character Limit Reached)."
+                )
             break
 
-        response_msg += deal_content
+        parts.append(deal_content)
+        running_len += len(deal_content)
         deals_added_count += 1
 
-    return response_msg
+    return ''.join(parts)
 
 
 #  6. PAGINATION VIEW 
@@ -227,8 +458,25 @@ class DealsView(discord.ui.View):
         self.current_page = 0
         self.total_pages = (len(self.deals) + MAX_DEALS_PER_PAGE -
                             1) // MAX_DEALS_PER_PAGE
+        # Format every deal and page once; navigation then only swaps content
+        self._deal_strings = [format_deal(d) for d in self.deals]
+        self._pages = [
+            self._assemble_page(i) for i in range(max(self.total_pages, 1))
+        ]
         self.update_buttons()
 
+    def _assemble_page(self, page: int) -> str:
+        """Builds the message for one page from the pre-formatted deals."""
+        start_index = page * MAX_DEALS_PER_PAGE
+        end_index = start_index + MAX_DEALS_PER_PAGE
+        return assemble_deal_page(self._deal_strings[start_index:end_index],
+                                  page, self.total_pages, self.title)
+
+    @property
+    def current_message(self) -> str:
+        """The pre-assembled message for the page currently shown."""
+        return self._pages[self.current_page]
+
     def update_buttons(self):
         """Disables/enables buttons based on current page."""
         if len(self.children) >= 2:
@@ -240,9 +488,8 @@ class DealsView(discord.ui.View):
         """Formats and updates the message content."""
         try:
             self.update_buttons()
-            message = format_deal_message(self.deals, self.current_page,
-                                          self.total_pages, self.title)
-            await interaction.response.edit_message(content=message, view=self)
+            await interaction.response.edit_message(
+                content=self.current_message, view=self)
         except Exception as e:
             print(
                 f"ERROR: Failed to edit message for pagination (Page {self.current_page}): {e}"
@@ -281,8 +528,112 @@ class WootBotClient(discord.Client):
         super().__init__(intents=intents)
         self.tree = app_commands.CommandTree(self)
         self.all_qualified_deals: List[Dict[str, Any]] = []
-        self.last_fetch_time: float = 0
+        self.top_deals: List[Dict[str, Any]] = []
+        self.deals_by_feed: Dict[str, List[Dict[str, Any]]] = {
+            name: []
+            for name in FEED_NAMES
+        }
+        # Monotonic clock; -inf so the very first call always fetches
+        self.last_fetch_time: float = float('-inf')
+        # When the last completed refresh began; used to share refreshes
+        self.last_fetch_started_at: float = float('-inf')
         self.MAX_CACHE_AGE_SECONDS = 300
+        self._http: aiohttp.ClientSession | None = None
+        self._concurrency: float = MAX_FETCH_CONCURRENCY
+        self._backed_off_this_refresh = False
+        self._feed_cache: Dict[tuple, tuple] = {}
+        self._web_runner: web.AppRunner | None = None
+        self._refresh_lock = asyncio.Lock()
+
+    def get_http_session(self) -> aiohttp.ClientSession:
+        """
+        Lazily creates the shared HTTP session used for all Woot API calls.
+        Every feed lives on the same host, so the pool is sized per host and
+        DNS results are cached to keep connections warm across refreshes.
+        """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                # The API key is sent per request so a changed key takes effect
+                headers={'Accept': 'application/json'},
+                connector=aiohttp.TCPConnector(limit=16,
+                                               limit_per_host=16,
+                                               ttl_dns_cache=300,
+                                               keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=10))
+        return self._http
+
+    async def close(self):
+        """Closes the shared HTTP session before shutting down the client."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        if self._web_runner is not None:
+            await self._web_runner.cleanup()
+            self._web_runner = None
+        await super().close()
+
+    async def setup_hook(self):
+        """Runs once before connecting to the gateway."""
+        await self._run_http()
+        # before_loop waits for the ready signal before the first tick
+        self.auto_refresh_deals.start()
+
+    async def _run_http(self):
+        """Serves the keep-alive endpoint on the bot's own event loop (Essential for Replit uptime)."""
+        app = web.Application()
+        app.router.add_get('/', home)
+        runner = web.AppRunner(app)
+        try:
+            await runner.setup()
+            self._web_runner = runner
+            await web.TCPSite(runner, '0.0.0.0',
+                              int(os.environ.get('PORT', 8080))).start()
+            print("Keep-alive web server started.")
+        except Exception as e:
+            # The bot itself can still run without the keep-alive server
+            print(f"ERROR: Could not start keep-alive web server: {e}")
+
+    def _on_rate_limit(self):
+        """
+        Multiplicatively backs off the feed concurrency after a 429. A burst of
+        429s within one refresh is one congestion event, so halve only once.
+        """
+        if self._backed_off_this_refresh:
+            return
+        self._backed_off_this_refresh = True
+        self._concurrency = max(MIN_FETCH_CONCURRENCY,
+                                self._concurrency * 0.5)
+
+    def _on_fetch_success(self):
+        """Additively restores the feed concurrency after a successful call."""
+        self._concurrency = min(MAX_FETCH_CONCURRENCY,
+                                self._concurrency + 0.5)
+
+    async def _fetch_feed_limited(self, session: aiohttp.ClientSession,
+                                  semaphore: asyncio.Semaphore, feed_name,
+                                  api_key):
+        """Fetches one feed while holding a slot of the refresh semaphore."""
+        async with semaphore:
+            return await fetch_feed_data(session,
+                                         feed_name,
+                                         api_key,
+                                         on_rate_limit=self._on_rate_limit,
+                                         on_success=self._on_fetch_success)
+
+    async def _get_feed(self, session: aiohttp.ClientSession,
+                        semaphore: asyncio.Semaphore, feed_name, api_key):
+        """Returns a feed's deals, reusing the cached payload while it is fresh."""
+        cache_key = (feed_name, api_key)
+        fetched_at, payload = self._feed_cache.get(cache_key, (0, None))
+        if (payload is not None
+                and time.monotonic() - fetched_at < PER_FEED_TTL):
+            return payload
+
+        payload = await self._fetch_feed_limited(session, semaphore,
+                                                 feed_name, api_key)
+        # Failed fetches also come back empty, so only cache real payloads
+        if payload:
+            self._feed_cache[cache_key] = (time.monotonic(), payload)
+        return payload
 
     async def on_ready(self):
         await self.tree.sync()
@@ -299,7 +650,7 @@ class WootBotClient(discord.Client):
             self.auto_refresh_deals.stop()
             return
 
-        settings = load_settings()
+        settings = await asyncio.to_thread(load_settings)
         channel_id_str = settings.get("alerts_channel_id")
         channel = None
 
@@ -315,6 +666,13 @@ class WootBotClient(discord.Client):
                     f"ERROR: Alerts Channel ID in settings file is not a valid number."
                 )
 
+        # Skip rather than queue behind a refresh that /refresh (or a
+        # cold-cache command) already has in flight. Checked here, with no
+        # await before fetch_and_filter_deals_internal takes the lock.
+        if self._refresh_lock.locked():
+            print("A deal refresh is already running, skipping this tick.")
+            return
+
         try:
             print("Running scheduled 4-minute Woot API refresh...")
             # 1. Fetch and process deals (updates self.all_qualified_deals)
@@ -331,6 +689,10 @@ class WootBotClient(discord.Client):
                         f"📣 **Woot Deal Alert!** The 4-minute check found **{total_deals}** "
                         f"exceptional deals that meet the criteria.\n"
                         f"Quickly view them now using the `/deals` command!")
+                    if total_deals > MAX_RANKED_DEALS:
+                        message_content += (
+                            f"\n`/deals` lists the top {MAX_RANKED_DEALS}; use "
+                            f"`/category` or `/search` to see the rest.")
                     await channel.send(message_content)
                 else:
                     # Optional: Send a low-key confirmation, or remove this else block to send nothing
@@ -357,46 +719,74 @@ class WootBotClient(discord.Client):
         Fetches deals, filters them by strict rules, tracks historical lows, 
         and updates the internal cache. Uses cache if fresh.
         """
-        if not force_refresh and (time.time() - self.last_fetch_time
+        if not force_refresh and (time.monotonic() - self.last_fetch_time
                                   < self.MAX_CACHE_AGE_SECONDS):
             return self.all_qualified_deals
 
+        requested_at = time.monotonic()
+        # One refresh at a time: they share the historical lows file and cache
+        async with self._refresh_lock:
+            # A refresh that started after this request finished while we
+            # waited, so its data is at least as new as a fresh fetch
+            if self.last_fetch_started_at >= requested_at:
+                return self.all_qualified_deals
+            return await self._refresh_deals(api_key)
+
+    async def _refresh_deals(self, api_key: str) -> List[Dict[str, Any]]:
+        """Runs one full fetch/filter pass. Callers must hold _refresh_lock."""
+        started_at = time.monotonic()
         print("Starting Woot API refresh...")
-        load_historical_lows()
+        await asyncio.to_thread(load_historical_lows)
         all_qualified_deals = []
 
-        loop = asyncio.get_event_loop()
-
-        for feed_name in FEED_NAMES:
-            deals_data = await loop.run_in_executor(None, fetch_feed_data,
-                                                    feed_name, api_key)
-
-            for raw_deal in deals_data:
-                deal = process_deal_data(raw_deal, feed_name)
-
-                if passes_strict_rules(deal):
-                    offer_id = deal['offer_id']
-
-                    current_low = historical_lows_cache.get(
-                        offer_id, float('inf'))
-
-                    if deal['sale_price'] < current_low:
-                        save_historical_low(offer_id, deal['sale_price'])
-
-                        deal['status'] = "NEW LOW" if current_low == float(
-                            'inf') else f"PRICE DROP (Was ${current_low:.2f})"
-                        all_qualified_deals.append(deal)
-                    else:
-                        deal['status'] = "GREAT DEAL"
-                        all_qualified_deals.append(deal)
+        session = self.get_http_session()
+        # Rebuilt every refresh so it picks up the latest AIMD concurrency
+        semaphore = asyncio.Semaphore(int(self._concurrency))
+        self._backed_off_this_refresh = False
+        results = await asyncio.gather(
+            *(self._get_feed(session, semaphore, name, api_key)
+              for name in FEED_NAMES))
+
+        for feed_name, deals_data in zip(FEED_NAMES, results):
+            # Only pre-filtered candidates are turned into dicts
+            for index in candidate_deal_indices(deals_data):
+                deal = process_deal_data(deals_data[index], feed_name)
+                if not passes_strict_rules(deal):
+                    continue
+                # Stored under str keys, as JSON objects only have those
+                offer_id = str(deal['offer_id'])
+
+                # A single dict probe already fast-rejects unseen offers
+                current_low = historical_lows_cache.get(offer_id)
+
+                if current_low is None or deal['sale_price'] < current_low:
+                    save_historical_low(offer_id, deal['sale_price'])
+
+                    deal['status'] = ("NEW LOW" if current_low is None else
+                                      f"PRICE DROP (Was ${current_low:.2f})")
+                    all_qualified_deals.append(deal)
+                else:
+                    deal['status'] = "GREAT DEAL"
+                    all_qualified_deals.append(deal)
 
-            await asyncio.sleep(random.uniform(1.1, 1.3))
+        await flush_historical_lows()
 
+        # One full sort: /search and /category need every deal in order, so
+        # the listings below are all slices of this list
         all_qualified_deals.sort(key=lambda d: d['discount_percent'],
                                  reverse=True)
 
+        # Index by feed so /category is a plain lookup; built from the sorted
+        # list, each bucket is already in discount order
+        deals_by_feed = {name: [] for name in FEED_NAMES}
+        for deal in all_qualified_deals:
+            deals_by_feed[deal['feed_name']].append(deal)
+
         self.all_qualified_deals = all_qualified_deals
-        self.last_fetch_time = time.time()
+        self.top_deals = all_qualified_deals[:MAX_RANKED_DEALS]
+        self.deals_by_feed = deals_by_feed
+        self.last_fetch_started_at = started_at
+        self.last_fetch_time = time.monotonic()
         print("Woot API refresh complete.")
         return self.all_qualified_deals
 
@@ -433,7 +823,7 @@ async def help_command(interaction: discord.Interaction):
         "## 🔄 Maintenance Commands\n"
         "| Command | Description |\n"
         "| : | : |\n"
-        "| `/refresh` | Manually forces the bot to check all feeds immediately. (Usually takes ~15 seconds and is done automatically every 4 minutes). |\n"
+        f"| `/refresh` | Manually forces the bot to re-check the deals now. Feeds fetched in the last {PER_FEED_TTL // 60} minutes are reused. (Usually takes a few seconds and is done automatically every 4 minutes). |\n"
         "| `/help` | Shows this guide. |\n\n"
         "**Note:** Deals labeled as **PRICE DROP** are currently at a lower price than ever recorded by the bot!"
     )
@@ -458,7 +848,8 @@ async def set_alerts_channel(interaction: discord.Interaction,
 
     new_channel_id = str(channel.id)
 
-    if save_setting("alerts_channel_id", new_channel_id):
+    if await asyncio.to_thread(save_setting, "alerts_channel_id",
+                               new_channel_id):
         response_msg = (
             f"✅ Success! Automatic Woot deal alerts will now be sent to {channel.mention} "
             f"(ID: `{new_channel_id}`).\n\n"
@@ -472,7 +863,8 @@ async def set_alerts_channel(interaction: discord.Interaction,
 @client.tree.command(
     name="refresh",
     description=
-    "Forces the bot to immediately check the Woot API for new deals.")
+    f"Re-checks deals now, refetching any Woot feed older than {PER_FEED_TTL // 60} minutes."
+)
 async def refresh_command(interaction: discord.Interaction):
 
     await interaction.response.defer(thinking=True)
@@ -484,10 +876,10 @@ async def refresh_command(interaction: discord.Interaction):
         return
 
     try:
-        start_time = time.time()
+        start_time = time.monotonic()
         await client.fetch_and_filter_deals_internal(api_key,
                                                      force_refresh=True)
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
 
         if not client.all_qualified_deals:
             msg = f"✅ Refresh complete in {elapsed:.2f}s. No new exceptional deals found."
@@ -496,7 +888,7 @@ async def refresh_command(interaction: discord.Interaction):
 
         await interaction.followup.send(msg)
 
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         await interaction.followup.send(
             f"An error occurred while connecting to Woot API during refresh: {e}"
         )
@@ -522,7 +914,8 @@ async def list_deals(interaction: discord.Interaction):
         return
 
     try:
-        all_deals = await client.fetch_and_filter_deals_internal(api_key)
+        await client.fetch_and_filter_deals_internal(api_key)
+        all_deals = client.top_deals
 
         if not all_deals:
             await interaction.followup.send(
@@ -531,15 +924,13 @@ async def list_deals(interaction: discord.Interaction):
             return
 
         title = f"Top {len(all_deals)} Exceptional Woot Deals"
-        total_pages = (len(all_deals) + MAX_DEALS_PER_PAGE -
-                       1) // MAX_DEALS_PER_PAGE
 
         view = DealsView(all_deals, title)
-        message = format_deal_message(all_deals, 0, total_pages, title)
+        message = view.current_message
 
         await interaction.followup.send(content=message, view=view)
 
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         await interaction.followup.send(
             f"An error occurred while connecting to Woot API: {e}")
     except Exception as e:
@@ -565,11 +956,9 @@ async def category_deals(interaction: discord.Interaction, feed_name: str):
         return
 
     try:
-        all_deals = await client.fetch_and_filter_deals_internal(api_key)
+        await client.fetch_and_filter_deals_internal(api_key)
 
-        category_deals_list = [
-            deal for deal in all_deals if deal['feed_name'] == feed_name
-        ]
+        category_deals_list = client.deals_by_feed.get(feed_name, [])
 
         if not category_deals_list:
             response_msg = f"🔍 No exceptional deals found in the **{feed_name}** category at this time."
@@ -577,16 +966,13 @@ async def category_deals(interaction: discord.Interaction, feed_name: str):
             return
 
         title = f"Exceptional Deals in {feed_name}"
-        total_pages = (len(category_deals_list) + MAX_DEALS_PER_PAGE -
-                       1) // MAX_DEALS_PER_PAGE
 
         view = DealsView(category_deals_list, title)
-        message = format_deal_message(category_deals_list, 0, total_pages,
-                                      title)
+        message = view.current_message
 
         await interaction.followup.send(content=message, view=view)
 
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         await interaction.followup.send(
             f"An error occurred while connecting to Woot API: {e}")
     except Exception as e:
@@ -617,7 +1003,7 @@ async def search_deals(interaction: discord.Interaction, item_name: str):
         search_term = item_name.lower()
         matching_deals = [
             deal for deal in qualifying_deals
-            if search_term in deal['title'].lower()
+            if search_term in deal['_title_lower']
         ]
 
         if not matching_deals:
@@ -625,18 +1011,15 @@ async def search_deals(interaction: discord.Interaction, item_name: str):
             await interaction.followup.send(response_msg)
             return
 
-        matching_deals.sort(key=lambda d: d['discount_percent'], reverse=True)
-
+        # qualifying_deals is already sorted by discount, and so is this subset
         title = f"{len(matching_deals)} Deals Matching '{item_name}'"
-        total_pages = (len(matching_deals) + MAX_DEALS_PER_PAGE -
-                       1) // MAX_DEALS_PER_PAGE
 
         view = DealsView(matching_deals, title)
-        message = format_deal_message(matching_deals, 0, total_pages, title)
+        message = view.current_message
 
         await interaction.followup.send(content=message, view=view)
 
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         await interaction.followup.send(
             f"An error occurred while connecting to Woot API: {e}")
     except Exception as e:
@@ -647,32 +1030,12 @@ async def search_deals(interaction: discord.Interaction, item_name: str):
 
 #  9. UPTIME KEEP-ALIVE SERVER - Irrelevant for non-Replit
 
-app = Flask('')
-
-
-@app.route('/')
-def home():
+async def home(request: web.Request) -> web.Response:
     """Simple route to confirm the server is running."""
-    return "WootDeals Bot is running!"
-
-
-def run_web_server():
-    """Starts the Flask web server."""
-    app.run(host='0.0.0.0', port=os.environ.get('PORT', 8080))
-
-
-def start_server_thread():
-    """Starts the web server in a separate thread so it doesn't block the Discord bot."""
-    server_thread = Thread(target=run_web_server)
-    server_thread.daemon = True
-    server_thread.start()
-    print("Keep-alive web server started.")
+    return web.Response(text="WootDeals Bot is running!")
 
 
 if __name__ == '__main__':
-    # Start the web server in the background (Essential for Replit uptime)
-    start_server_thread()
-
     bot_token = os.environ.get(DISCORD_BOT_TOKEN_ENV_VAR)
     if not bot_token:
         print(